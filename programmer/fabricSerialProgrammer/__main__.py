@@ -0,0 +1,9 @@
+"""
+Entry point when run as a directory or zipapp, program.py is imported
+so its compiled bytecode is cached instead of recompiled every run.
+
+    $ python3 programmer/fabricSerialProgrammer --test
+"""
+from program import run
+
+run()